@@ -2,17 +2,23 @@ from fastapi import FastAPI
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from controllers.controllers import router
-from db.database import engine
+from db.database import engine, check_schema
 from models.models import Base
 from prometheus_fastapi_instrumentator import Instrumentator
 import logging
 from utils.logging_db import DBLogHandler
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.inmemory import InMemoryBackend
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from controllers.controllers import get_token_from_cookie
-from fastapi.responses import Response
+from fastapi.responses import Response, PlainTextResponse
+from utils.compression import (
+    CompressionMiddleware,
+    COMPRESSION_LEVEL,
+    COMPRESSION_MINIMUM_SIZE,
+)
+from utils.profiler import profiler, ProfilerMiddleware
 
 from contextlib import asynccontextmanager
 
@@ -26,6 +32,12 @@ async def lifespan(app: FastAPI):
 app = FastAPI(title="Math Operations API", version="1.0", lifespan=lifespan)
 
 app.include_router(router)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MINIMUM_SIZE,
+    compresslevel=COMPRESSION_LEVEL,
+)
+app.add_middleware(ProfilerMiddleware)
 
 
 db_handler = DBLogHandler()
@@ -52,8 +64,26 @@ def admin_metrics(token: dict = Depends(get_token_from_cookie)):
     return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
+@app.get("/admin/profile", tags=["Admin"])
+async def admin_profile(
+    seconds: float = Query(10, gt=0, le=120),
+    requests: int = Query(None, gt=0),
+    interval: float = Query(0.005, ge=0.001, le=1),
+    token: dict = Depends(get_token_from_cookie),
+):
+    if token.get("role") != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    if profiler.sampler is not None:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    sampler = await profiler.profile(seconds, requests, interval)
+    return PlainTextResponse(
+        sampler.collapsed(), headers={"X-Profile-Samples": str(sampler.samples)}
+    )
+
+
 setup_monitoring(app)
 
 
 # Create tables
 Base.metadata.create_all(bind=engine)
+check_schema(engine)
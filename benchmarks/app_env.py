@@ -0,0 +1,46 @@
+import os
+import tempfile
+
+# controllers reads these at import time
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+from fastapi_cache import FastAPICache  # noqa: E402
+from fastapi_cache.backends.inmemory import InMemoryBackend  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+import db.database as database  # noqa: E402
+import services.services as services  # noqa: E402
+from models.models import Base  # noqa: E402
+
+
+class FakeRedis:
+    """In-process stand-in for the Redis client; keeps XADD entries in memory."""
+
+    def __init__(self):
+        self.streams = {}
+
+    def xadd(self, name, fields):
+        entries = self.streams.setdefault(name, [])
+        entries.append(fields)
+        return f"{len(entries)}-0".encode()
+
+
+def setup(workdir: str = None):
+    """Point the app at a throwaway SQLite file, a fake Redis and an in-memory cache.
+
+    Must run before `app` is imported. Returns the session factory bound to the
+    benchmark database.
+    """
+    workdir = workdir or tempfile.mkdtemp(prefix="mathapp-bench-")
+    engine = create_engine(
+        f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    # app imports `engine` for create_all, so swap it before `app` is imported
+    database.engine = engine
+    # DBLogHandler and get_db both use this sessionmaker
+    database.SessionLocal.configure(bind=engine)
+    services.redis_client = FakeRedis()
+    FastAPICache.init(InMemoryBackend(), prefix="bench")
+    return database.SessionLocal
@@ -0,0 +1,36 @@
+from services.arithmetic import BACKENDS, load_backend
+
+SIZES = {
+    "fibonacci": (1000, 20000, 100000),
+    "factorial": (100, 1550, 10000),
+}
+
+
+def available_backends():
+    backends = []
+    for name in BACKENDS:
+        try:
+            backends.append(load_backend(name))
+        except ImportError:
+            pass
+    return backends
+
+
+def bench_backends(measure, iterations: int) -> dict:
+    """Each installed backend on the same inputs, including sizes past the API limits."""
+    results = {}
+    for backend in available_backends():
+        for n in SIZES["fibonacci"]:
+            results[f"arith.{backend.name}.fibonacci[n={n}]"] = measure(
+                lambda: backend.fibonacci(n), iterations
+            )
+        for n in SIZES["factorial"]:
+            results[f"arith.{backend.name}.factorial[n={n}]"] = measure(
+                lambda: backend.factorial(n), iterations
+            )
+        # Stay below CPython's default 4300-digit str() limit
+        value = backend.factorial(1550)
+        results[f"arith.{backend.name}.to_decimal[factorial(1550)]"] = measure(
+            lambda: backend.to_decimal(value), iterations
+        )
+    return results
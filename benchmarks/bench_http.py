@@ -0,0 +1,75 @@
+import httpx
+from controllers.controllers import create_access_token
+
+
+def make_client(app, username: str = "bench") -> httpx.AsyncClient:
+    """Client that calls the ASGI app in-process with a valid auth cookie.
+
+    Background tasks run before the call returns, so persistence is included.
+    """
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    )
+    client.cookies.set(
+        "access_token", create_access_token({"sub": username, "role": "user"})
+    )
+    return client
+
+
+async def _checked(request):
+    response = await request
+    response.raise_for_status()
+    return response
+
+
+async def bench_requests(ameasure, app, iterations: int) -> dict:
+    results = {}
+    async with make_client(app) as client:
+        results["http.fibonacci[cache_hit,n=5000]"] = await ameasure(
+            lambda i: _checked(client.post("/fibonacci", json={"n": 5000})),
+            iterations,
+        )
+        # A new n on every call, so every request computes and stores a new result
+        results["http.fibonacci[cache_miss,n~5000]"] = await ameasure(
+            lambda i: _checked(client.post("/fibonacci", json={"n": 5001 + i})),
+            iterations,
+            warmup=0,
+        )
+        results["http.factorial[get,cache_hit,n=1550]"] = await ameasure(
+            lambda i: _checked(client.get("/factorial", params={"n": 1550})),
+            iterations,
+        )
+        results["http.factorial[get,gzip,n=1550]"] = await ameasure(
+            lambda i: _checked(
+                client.get(
+                    "/factorial",
+                    params={"n": 1550},
+                    headers={"Accept-Encoding": "gzip"},
+                )
+            ),
+            iterations,
+        )
+        results["http.me[jwt_only]"] = await ameasure(
+            lambda i: _checked(client.get("/me")), iterations
+        )
+    return results
+
+
+async def bench_load(run_load, app, concurrency: int, total_requests: int) -> dict:
+    results = {}
+    async with make_client(app) as client:
+        results[f"load.fibonacci[cache_hit,c={concurrency}]"] = await run_load(
+            lambda i: _checked(client.post("/fibonacci", json={"n": 1000})),
+            concurrency,
+            total_requests,
+        )
+        results[f"load.mixed[c={concurrency}]"] = await run_load(
+            lambda i: _checked(
+                client.post(
+                    ("/fibonacci", "/factorial")[i % 2], json={"n": 100 + i % 50}
+                )
+            ),
+            concurrency,
+            total_requests,
+        )
+    return results
@@ -0,0 +1,36 @@
+import logging
+import services.services as services
+from utils.logging_db import DBLogHandler
+
+
+def bench_persist_request(measure, iterations: int, session_factory) -> dict:
+    db = session_factory()
+    value = 3**5000
+    counter = iter(range(10**9))
+    try:
+        return {
+            # Same params every time: only the audit row is new
+            "persist_request[repeat]": measure(
+                lambda: services.persist_request(
+                    db, "factorial", 1000, None, value, "bench"
+                ),
+                iterations,
+            ),
+            # New params every time: result row and audit row are written
+            "persist_request[unique]": measure(
+                lambda: services.persist_request(
+                    db, "fibonacci", next(counter), None, value, "bench"
+                ),
+                iterations,
+            ),
+        }
+    finally:
+        db.close()
+
+
+def bench_log_handler(measure, iterations: int) -> dict:
+    handler = DBLogHandler()
+    record = logging.LogRecord(
+        "bench", logging.INFO, __file__, 0, "benchmark log line", None, None
+    )
+    return {"db_log_handler.emit": measure(lambda: handler.emit(record), iterations)}
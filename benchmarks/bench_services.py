@@ -0,0 +1,52 @@
+import asyncio
+import services.services as services
+
+SIZES = {
+    "fibonacci": (10, 100, 1000, 5000, 20000),
+    "factorial": (10, 100, 500, 1000, 1550),
+    "pow": (2, 10, 100, 1000),
+}
+
+
+def _call(func, *args):
+    return asyncio.run(func(*args))
+
+
+def bench_compute(measure, iterations: int) -> dict:
+    """Undecorated compute functions, i.e. the cost of a cache miss."""
+    results = {}
+    fibonacci = services.calculate_fibonacci.__wrapped__
+    factorial = services.calculate_factorial.__wrapped__
+    power = services.calculate_pow.__wrapped__
+    loop = asyncio.new_event_loop()
+    try:
+        for n in SIZES["fibonacci"]:
+            results[f"compute.fibonacci[n={n}]"] = measure(
+                lambda: loop.run_until_complete(fibonacci(n)), iterations
+            )
+        for n in SIZES["factorial"]:
+            results[f"compute.factorial[n={n}]"] = measure(
+                lambda: loop.run_until_complete(factorial(n)), iterations
+            )
+        for exponent in SIZES["pow"]:
+            results[f"compute.pow[exponent={exponent}]"] = measure(
+                lambda: loop.run_until_complete(power(1.0001, exponent)), iterations
+            )
+    finally:
+        loop.close()
+    return results
+
+
+def bench_encoding(measure, iterations: int) -> dict:
+    """Decimal conversion and compression of the largest results."""
+    results = {}
+    values = {
+        "fibonacci": _call(services.calculate_fibonacci.__wrapped__, 20000),
+        "factorial": _call(services.calculate_factorial.__wrapped__, 1550),
+    }
+    for name, value in values.items():
+        results[f"encode.str.{name}[max]"] = measure(lambda: str(value), iterations)
+        results[f"encode.result.{name}[max]"] = measure(
+            lambda: services.encode_result(value), iterations
+        )
+    return results
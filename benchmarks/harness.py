@@ -0,0 +1,114 @@
+import asyncio
+import json
+import math
+import platform
+import sys
+import time
+from datetime import datetime, UTC
+
+
+def percentile(sorted_values, q: float) -> float:
+    # Nearest-rank percentile on an already sorted list
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(q / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def summarize(latencies, elapsed: float = None) -> dict:
+    values = sorted(latencies)
+    total = elapsed if elapsed is not None else sum(values)
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": values[-1] if values else 0.0,
+        "ops_per_sec": len(values) / total if total else 0.0,
+    }
+
+
+def measure(func, iterations: int, warmup: int = 1) -> dict:
+    for _ in range(warmup):
+        func()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return summarize(latencies)
+
+
+async def ameasure(make_call, iterations: int, warmup: int = 1) -> dict:
+    """Time `await make_call(i)` for i in range(iterations)."""
+    for i in range(warmup):
+        await make_call(-1 - i)
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await make_call(i)
+        latencies.append(time.perf_counter() - start)
+    return summarize(latencies)
+
+
+async def run_load(make_call, concurrency: int, total_requests: int) -> dict:
+    """Run `total_requests` calls from `concurrency` concurrent workers."""
+    latencies = []
+    errors = 0
+    counter = iter(range(total_requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                await make_call(i)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    stats = summarize(latencies, time.perf_counter() - start)
+    stats["concurrency"] = concurrency
+    stats["errors"] = errors
+    return stats
+
+
+def environment() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+
+
+def save(path: str, results: dict, config: dict):
+    with open(path, "w") as f:
+        json.dump(
+            {"environment": environment(), "config": config, "results": results},
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(baseline: dict, current: dict, metric: str = "p50", threshold: float = 1.2):
+    """Return (name, baseline, current, ratio, regressed) for benchmarks in both runs."""
+    rows = []
+    for name, stats in current.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name][metric], stats[metric]
+        ratio = new / old if old else float("inf")
+        rows.append((name, old, new, ratio, ratio > threshold))
+    return rows
@@ -0,0 +1,128 @@
+"""Run the benchmark suite against an in-process app.
+
+Usage:
+python -m benchmarks.run --output benchmarks/results/baseline.json
+python -m benchmarks.run --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from benchmarks import app_env, harness
+
+SUITES = ("services", "arithmetic", "persistence", "http", "load")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", choices=SUITES, action="append")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument(
+        "--quick", action="store_true", help="few iterations, for smoke runs"
+    )
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument(
+        "--metric", default="p50", choices=("mean", "p50", "p95", "p99")
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="slowdown ratio that counts as a regression",
+    )
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.iterations, args.requests, args.concurrency = 5, 50, 4
+    args.suite = args.suite or list(SUITES)
+    return args
+
+
+def run(args) -> dict:
+    session_factory = app_env.setup()
+    results = {}
+    if "services" in args.suite:
+        from benchmarks.bench_services import bench_compute, bench_encoding
+
+        results.update(bench_compute(harness.measure, args.iterations))
+        results.update(bench_encoding(harness.measure, args.iterations))
+    if "arithmetic" in args.suite:
+        from benchmarks.bench_arithmetic import bench_backends
+
+        results.update(bench_backends(harness.measure, args.iterations))
+    if "persistence" in args.suite:
+        from benchmarks.bench_persistence import (
+            bench_persist_request,
+            bench_log_handler,
+        )
+
+        results.update(
+            bench_persist_request(harness.measure, args.iterations, session_factory)
+        )
+        results.update(bench_log_handler(harness.measure, args.iterations))
+    if "http" in args.suite or "load" in args.suite:
+        from app import app
+        from benchmarks.bench_http import bench_requests, bench_load
+
+        async def run_http():
+            if "http" in args.suite:
+                results.update(
+                    await bench_requests(harness.ameasure, app, args.iterations)
+                )
+            if "load" in args.suite:
+                results.update(
+                    await bench_load(
+                        harness.run_load, app, args.concurrency, args.requests
+                    )
+                )
+
+        asyncio.run(run_http())
+    return results
+
+
+def print_results(results: dict):
+    print(
+        f"{'benchmark':<45} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'ops/s':>10}"
+    )
+    for name, stats in results.items():
+        print(
+            f"{name:<45} {stats['p50'] * 1000:>10.3f} {stats['p95'] * 1000:>10.3f} "
+            f"{stats['p99'] * 1000:>10.3f} {stats['ops_per_sec']:>10.1f}"
+        )
+
+
+def print_comparison(rows, metric: str) -> bool:
+    regressed = False
+    print(
+        f"\n{'benchmark':<45} {'base ' + metric:>12} {'new ' + metric:>12} {'ratio':>7}"
+    )
+    for name, old, new, ratio, is_regression in rows:
+        flag = "  REGRESSION" if is_regression else ""
+        regressed = regressed or is_regression
+        print(
+            f"{name:<45} {old * 1000:>10.3f}ms {new * 1000:>10.3f}ms {ratio:>7.2f}{flag}"
+        )
+    return regressed
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    results = run(args)
+    print_results(results)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        harness.save(args.output, results, vars(args))
+        print(f"\nSaved results to {args.output}")
+    if args.compare:
+        baseline = harness.load(args.compare)["results"]
+        rows = harness.compare(baseline, results, args.metric, args.threshold)
+        if print_comparison(rows, args.metric):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,11 +5,12 @@ from fastapi import (
     Request,
     Response,
     BackgroundTasks,
+    Query,
 )
 from sqlalchemy.orm import Session
 from schemas.schemas import PowRequest, FibonacciRequest, FactorialRequest, MathResponse
 from services.services import calculate_pow, calculate_fibonacci
-from services.services import calculate_factorial, persist_request
+from services.services import calculate_factorial, enqueue_persist, decode_result
 from db.database import get_db
 from fastapi.security import OAuth2PasswordRequestForm
 from jose import JWTError, jwt
@@ -20,6 +21,9 @@ from passlib.context import CryptContext
 import os
 from dotenv import load_dotenv
 import logging
+from typing import Annotated
+from utils.http_cache import cacheable_response
+from utils.metrics import observe_stage
 
 load_dotenv()
 
@@ -58,7 +62,8 @@ def get_token_from_cookie(request: Request):
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        with observe_stage("jwt_decode"):
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
@@ -134,50 +139,111 @@ def get_current_user(token: dict = Depends(get_token_from_cookie)):
     return {"username": token["sub"], "role": token["role"]}
 
 
+async def _pow(request, http_request, db, token, background_tasks):
+    result = await calculate_pow(request.base, request.exponent)
+    enqueue_persist(
+        background_tasks,
+        db,
+        "pow",
+        request.base,
+        request.exponent,
+        result,
+        token["sub"],
+    )
+    response = MathResponse(
+        operation="pow",
+        input={"base": request.base, "exponent": request.exponent},
+        result=result,
+    )
+    return cacheable_response(http_request, response.model_dump())
+
+
+async def _fibonacci(request, http_request, db, token, background_tasks):
+    result = await calculate_fibonacci(request.n)
+    enqueue_persist(
+        background_tasks, db, "fibonacci", request.n, None, result, token["sub"]
+    )
+    response = MathResponse(
+        operation="fibonacci", input={"n": request.n}, result=result
+    )
+    return cacheable_response(http_request, response.model_dump())
+
+
+async def _factorial(request, http_request, db, token, background_tasks):
+    result = await calculate_factorial(request.n)
+    enqueue_persist(
+        background_tasks, db, "factorial", request.n, None, result, token["sub"]
+    )
+    response = MathResponse(
+        operation="factorial", input={"n": request.n}, result=result
+    )
+    return cacheable_response(http_request, response.model_dump())
+
+
 @router.post("/pow", response_model=MathResponse)
 async def pow_endpoint(
     request: PowRequest,
+    http_request: Request,
     db: Session = Depends(get_db),
     token: dict = Depends(get_token_from_cookie),
     background_tasks: BackgroundTasks = None,
 ):
-    result = await calculate_pow(request.base, request.exponent)
-    background_tasks.add_task(
-        persist_request, db, "pow", request.base, request.exponent, result, token["sub"]
-    )
-    return MathResponse(
-        operation="pow",
-        input={"base": request.base, "exponent": request.exponent},
-        result=result,
-    )
+    return await _pow(request, http_request, db, token, background_tasks)
+
+
+@router.get("/pow", response_model=MathResponse)
+async def pow_get_endpoint(
+    request: Annotated[PowRequest, Query()],
+    http_request: Request,
+    db: Session = Depends(get_db),
+    token: dict = Depends(get_token_from_cookie),
+    background_tasks: BackgroundTasks = None,
+):
+    return await _pow(request, http_request, db, token, background_tasks)
 
 
 @router.post("/fibonacci", response_model=MathResponse)
 async def fibonacci_endpoint(
     request: FibonacciRequest,
+    http_request: Request,
     db: Session = Depends(get_db),
     token: dict = Depends(get_token_from_cookie),
     background_tasks: BackgroundTasks = None,
 ):
-    result = await calculate_fibonacci(request.n)
-    background_tasks.add_task(
-        persist_request, db, "fibonacci", request.n, None, result, token["sub"]
-    )
-    return MathResponse(operation="fibonacci", input={"n": request.n}, result=result)
+    return await _fibonacci(request, http_request, db, token, background_tasks)
+
+
+@router.get("/fibonacci", response_model=MathResponse)
+async def fibonacci_get_endpoint(
+    request: Annotated[FibonacciRequest, Query()],
+    http_request: Request,
+    db: Session = Depends(get_db),
+    token: dict = Depends(get_token_from_cookie),
+    background_tasks: BackgroundTasks = None,
+):
+    return await _fibonacci(request, http_request, db, token, background_tasks)
 
 
 @router.post("/factorial", response_model=MathResponse)
 async def factorial_endpoint(
     request: FactorialRequest,
+    http_request: Request,
     db: Session = Depends(get_db),
     token: dict = Depends(get_token_from_cookie),
     background_tasks: BackgroundTasks = None,
 ):
-    result = await calculate_factorial(request.n)
-    background_tasks.add_task(
-        persist_request, db, "factorial", request.n, None, result, token["sub"]
-    )
-    return MathResponse(operation="factorial", input={"n": request.n}, result=result)
+    return await _factorial(request, http_request, db, token, background_tasks)
+
+
+@router.get("/factorial", response_model=MathResponse)
+async def factorial_get_endpoint(
+    request: Annotated[FactorialRequest, Query()],
+    http_request: Request,
+    db: Session = Depends(get_db),
+    token: dict = Depends(get_token_from_cookie),
+    background_tasks: BackgroundTasks = None,
+):
+    return await _factorial(request, http_request, db, token, background_tasks)
 
 
 @router.get("/admin/requests")
@@ -196,7 +262,7 @@ def get_math_requests(
             "operation": r.operation,
             "param1": r.param1,
             "param2": r.param2,
-            "result": r.result,
+            "result": decode_result(r.result.value) if r.result else None,
             "timestamp": r.timestamp.isoformat(),
             "username": r.username,
         }
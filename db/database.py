@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -17,3 +17,22 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def check_schema(bind=engine):
+    # create_all never alters existing tables, so an old database file keeps
+    # its old columns and every insert into it would fail
+    inspector = inspect(bind)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        missing = [
+            column.name for column in table.columns if column.name not in existing
+        ]
+        if missing:
+            raise RuntimeError(
+                f"Table '{table.name}' in {bind.url} is missing columns {missing}. "
+                "The database was created by an older version; back it up and run "
+                "`python -m db.migrations` to upgrade it."
+            )
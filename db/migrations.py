@@ -0,0 +1,101 @@
+"""One-off schema migrations for databases created by older versions.
+
+python -m db.migrations
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects.sqlite import insert
+from db.database import engine
+from models.models import MathRequest, MathResult
+from services.services import result_key, encode_result
+
+# Operations whose params are ints; old rows stored them as floats (200.0)
+_INT_PARAM_OPERATIONS = ("fibonacci", "factorial")
+
+
+def _normalize_param(operation: str, param):
+    if param is not None and operation in _INT_PARAM_OPERATIONS:
+        return int(param)
+    return param
+
+
+def migrate_math_requests(bind=engine) -> int:
+    """Move math_requests from inline results to the math_results table.
+
+    Old rows kept the result string and float params in math_requests. Each
+    result is stored once in math_results under the same key persist_request
+    uses, and the rows are copied into a rebuilt math_requests that references
+    it. Only math_requests is rebuilt; users and logs are left untouched.
+    Returns the number of migrated rows, or 0 if there was nothing to do.
+    """
+    inspector = inspect(bind)
+    if not inspector.has_table("math_requests"):
+        return 0
+    columns = {column["name"] for column in inspector.get_columns("math_requests")}
+    if "result_key" in columns:
+        return 0
+
+    with bind.begin() as conn:
+        # Keep the old data under another name until the copy has succeeded;
+        # its indexes are dropped so the new table can reuse their names
+        conn.execute(text("ALTER TABLE math_requests RENAME TO math_requests_old"))
+        index_names = conn.execute(
+            text(
+                "SELECT name FROM sqlite_master WHERE type = 'index' "
+                "AND tbl_name = 'math_requests_old' AND sql IS NOT NULL"
+            )
+        ).scalars()
+        for name in list(index_names):
+            conn.execute(text(f'DROP INDEX "{name}"'))
+        MathResult.__table__.create(conn, checkfirst=True)
+        MathRequest.__table__.create(conn)
+
+        rows = conn.execute(
+            text(
+                "SELECT id, operation, param1, param2, result, timestamp, username "
+                "FROM math_requests_old ORDER BY id"
+            )
+        ).all()
+        requests = []
+        for row in rows:
+            param1 = _normalize_param(row.operation, row.param1)
+            param2 = _normalize_param(row.operation, row.param2)
+            key = result_key(row.operation, param1, param2)
+            conn.execute(
+                insert(MathResult)
+                .values(
+                    key=key, operation=row.operation, value=encode_result(row.result)
+                )
+                .on_conflict_do_nothing(index_elements=["key"])
+            )
+            requests.append(
+                {
+                    "id": row.id,
+                    "operation": row.operation,
+                    "param1": str(param1) if param1 is not None else None,
+                    "param2": str(param2) if param2 is not None else None,
+                    "result_key": key,
+                    "timestamp": row.timestamp,
+                    "username": row.username,
+                }
+            )
+        if requests:
+            conn.execute(
+                text(
+                    "INSERT INTO math_requests "
+                    "(id, operation, param1, param2, result_key, timestamp, username) "
+                    "VALUES (:id, :operation, :param1, :param2, :result_key, "
+                    ":timestamp, :username)"
+                ),
+                requests,
+            )
+        conn.execute(text("DROP TABLE math_requests_old"))
+    return len(rows)
+
+
+if __name__ == "__main__":
+    migrated = migrate_math_requests()
+    if migrated:
+        print(f"Migrated {migrated} math requests to the math_results table.")
+    else:
+        print("math_requests is already up to date.")
@@ -1,17 +1,29 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary, ForeignKey
+from sqlalchemy.orm import relationship
 from db.database import Base
 from datetime import datetime, UTC
 
 
+class MathResult(Base):
+    __tablename__ = "math_results"
+    # sha256 of (operation, params), so each distinct result is stored once
+    key = Column(String(64), primary_key=True)
+    operation = Column(String, index=True)
+    value = Column(LargeBinary)  # zlib-compressed decimal string
+
+
 class MathRequest(Base):
     __tablename__ = "math_requests"
     id = Column(Integer, primary_key=True, index=True)
     operation = Column(String, index=True)
-    param1 = Column(Float, nullable=True)
-    param2 = Column(Float, nullable=True)
-    result = Column(String)
+    # Stored as text so big integers and floats keep full precision
+    param1 = Column(String, nullable=True)
+    param2 = Column(String, nullable=True)
+    result_key = Column(String(64), ForeignKey("math_results.key"), index=True)
     timestamp = Column(DateTime, default=lambda: datetime.now(UTC))
-    username = Column(String, index=True)  # Add this line
+    username = Column(String, index=True)
+
+    result = relationship(MathResult, lazy="joined")
 
 
 class LogEntry(Base):
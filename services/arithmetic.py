@@ -0,0 +1,64 @@
+import math
+import os
+
+
+class PythonBackend:
+    name = "python"
+
+    def factorial(self, n: int) -> int:
+        return math.factorial(n)
+
+    def fibonacci(self, n: int) -> int:
+        # Fast doubling: F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+        a, b = 0, 1
+        for bit in bin(n)[2:]:
+            c = a * (2 * b - a)
+            d = a * a + b * b
+            a, b = (d, c + d) if bit == "1" else (c, d)
+        return a
+
+    def to_decimal(self, value: int) -> str:
+        return str(value)
+
+
+class GMPBackend:
+    name = "gmp"
+
+    def __init__(self):
+        import gmpy2
+
+        self._gmpy2 = gmpy2
+
+    # Results are returned as Python ints so caching and JSON encoding keep working
+    def factorial(self, n: int) -> int:
+        return int(self._gmpy2.fac(n))
+
+    def fibonacci(self, n: int) -> int:
+        return int(self._gmpy2.fib(n))
+
+    def to_decimal(self, value: int) -> str:
+        return self._gmpy2.mpz(value).digits()
+
+
+BACKENDS = {"python": PythonBackend, "gmp": GMPBackend}
+
+
+def load_backend(name: str = "auto"):
+    """Return the named backend; "auto" uses gmpy2 when it is installed."""
+    if name == "auto":
+        try:
+            return GMPBackend()
+        except ImportError:
+            return PythonBackend()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown arithmetic backend '{name}'")
+    return BACKENDS[name]()
+
+
+backend = load_backend(os.getenv("ARITHMETIC_BACKEND", "auto"))
+
+
+def to_decimal(value) -> str:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return backend.to_decimal(value)
+    return str(value)
@@ -1,8 +1,19 @@
+import hashlib
 import logging
+import time
+import zlib
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
-from models.models import MathRequest
-from fastapi_cache.decorator import cache
+from models.models import MathRequest, MathResult
+from fastapi import BackgroundTasks
 import redis
+from services import arithmetic
+from utils.metrics import (
+    instrumented_cache,
+    observe_stage,
+    PERSIST_LAG,
+    PERSIST_PENDING,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +21,8 @@ logger = logging.getLogger(__name__)
 redis_client = redis.Redis(host="redis", port=6379, db=0)
 
 
-@cache(expire=3600)  # Cache for 1 hour
+# Cache for 1 hour
+@instrumented_cache("pow", expire=3600, size=lambda base, exponent: exponent)
 async def calculate_pow(base: float, exponent: float) -> float:
     try:
         logger.info(f"Calculating pow({base}, {exponent})")
@@ -20,68 +32,123 @@ async def calculate_pow(base: float, exponent: float) -> float:
         raise
 
 
-@cache(expire=3600)
+@instrumented_cache("fibonacci", expire=3600)
 async def calculate_fibonacci(n: int) -> int:
     try:
         logger.info(f"Calculating fibonacci({n})")
         if n < 0:
             logger.error("n must be >= 0 for fibonacci")
             raise ValueError("n must be >= 0")
-        a, b = 0, 1
-        for _ in range(n):
-            a, b = b, a + b
-        return a
+        return arithmetic.backend.fibonacci(n)
     except Exception as e:
         logger.error(f"Error in calculate_fibonacci: {e}")
         raise
 
 
-@cache(expire=3600)
+@instrumented_cache("factorial", expire=3600)
 async def calculate_factorial(n: int) -> int:
     try:
         logger.info(f"Calculating factorial({n})")
         if n < 0:
             logger.error("n must be >= 0 for factorial")
             raise ValueError("n must be >= 0")
-        result = 1
-        for i in range(2, n + 1):
-            result *= i
-        return result
+        return arithmetic.backend.factorial(n)
     except Exception as e:
         logger.error(f"Error in calculate_factorial: {e}")
         raise
 
 
-def persist_request(db: Session, operation: str, param1, param2, result, username):
+def _param_to_str(param):
+    return str(param) if param is not None else None
+
+
+def result_key(operation: str, param1, param2) -> str:
+    raw = f"{operation}:{_param_to_str(param1)}:{_param_to_str(param2)}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def encode_result(result) -> bytes:
+    return zlib.compress(arithmetic.to_decimal(result).encode())
+
+
+def decode_result(value: bytes) -> str:
+    return zlib.decompress(value).decode()
+
+
+def enqueue_persist(
+    background_tasks: BackgroundTasks,
+    db: Session,
+    operation: str,
+    param1,
+    param2,
+    result,
+    username,
+):
+    PERSIST_PENDING.inc()
+    background_tasks.add_task(
+        persist_request,
+        db,
+        operation,
+        param1,
+        param2,
+        result,
+        username,
+        enqueued_at=time.perf_counter(),
+    )
+
+
+def persist_request(
+    db: Session, operation: str, param1, param2, result, username, enqueued_at=None
+):
+    if enqueued_at is not None:
+        PERSIST_LAG.set(time.perf_counter() - enqueued_at)
     try:
-        req = MathRequest(
-            operation=operation,
-            param1=param1,
-            param2=param2,
-            result=str(result),
-            username=username,
-        )
-        db.add(req)
-        db.commit()
+        _persist_request(db, operation, param1, param2, result, username)
+    finally:
+        if enqueued_at is not None:
+            PERSIST_PENDING.dec()
+
+
+def _persist_request(db: Session, operation: str, param1, param2, result, username):
+    key = result_key(operation, param1, param2)
+    n = param2 if operation == "pow" else param1
+    try:
+        with observe_stage("audit_insert", operation, n):
+            # Results are deterministic, so only the first request stores the value
+            db.execute(
+                insert(MathResult)
+                .values(key=key, operation=operation, value=encode_result(result))
+                .on_conflict_do_nothing(index_elements=["key"])
+            )
+            req = MathRequest(
+                operation=operation,
+                param1=_param_to_str(param1),
+                param2=_param_to_str(param2),
+                result_key=key,
+                username=username,
+            )
+            db.add(req)
+            db.commit()
         logger.info(
             f"Persisted request: {operation} by {username} "
-            f"params: {param1}, {param2}, result: {result}"
+            f"params: {param1}, {param2}, result: {key}"
         )
     except Exception as e:
         logger.error(f"Error persisting request: {e}")
         db.rollback()
     # Redis Streams integration
     try:
-        redis_client.xadd(
-            "math_requests",
-            {
-                "operation": str(operation),
-                "param1": str(param1) if param1 is not None else "",
-                "param2": str(param2) if param2 is not None else "",
-                "result": str(result),
-                "username": str(username),
-            },
-        )
+        with observe_stage("redis_xadd", operation, n):
+            redis_client.xadd(
+                "math_requests",
+                {
+                    "operation": str(operation),
+                    "param1": str(param1) if param1 is not None else "",
+                    "param2": str(param2) if param2 is not None else "",
+                    "result": arithmetic.to_decimal(result),
+                    "username": str(username),
+                },
+            )
         logger.info("Request also sent to Redis Stream 'math_requests'")
     except Exception as re:
         logger.error(f"Failed to send request to Redis Stream: {re}")
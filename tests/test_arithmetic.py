@@ -0,0 +1,64 @@
+import math
+import pytest
+from services import arithmetic
+from services.arithmetic import PythonBackend, GMPBackend, load_backend
+
+
+def _reference_fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+SIZES = [0, 1, 2, 3, 10, 93, 94, 255, 1000, 1550]
+
+
+@pytest.fixture(params=["python", "gmp"])
+def backend(request):
+    if request.param == "gmp":
+        pytest.importorskip("gmpy2")
+    return load_backend(request.param)
+
+
+@pytest.mark.parametrize("n", SIZES + [20000])
+def test_fibonacci(backend, n):
+    result = backend.fibonacci(n)
+    assert type(result) is int
+    assert result == _reference_fibonacci(n)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_factorial(backend, n):
+    result = backend.factorial(n)
+    assert type(result) is int
+    assert result == math.factorial(n)
+
+
+@pytest.mark.parametrize("value", [0, 1, -1, 2**64, -(3**2000), math.factorial(1550)])
+def test_to_decimal(backend, value):
+    assert backend.to_decimal(value) == str(value)
+
+
+def test_backends_agree():
+    pytest.importorskip("gmpy2")
+    python, gmp = PythonBackend(), GMPBackend()
+    for n in range(0, 1551, 31):
+        assert python.fibonacci(n) == gmp.fibonacci(n)
+        assert python.factorial(n) == gmp.factorial(n)
+        assert python.to_decimal(python.factorial(n)) == gmp.to_decimal(
+            gmp.factorial(n)
+        )
+
+
+def test_load_backend():
+    assert load_backend("python").name == "python"
+    assert load_backend("auto").name in ("python", "gmp")
+    with pytest.raises(ValueError, match="Unknown arithmetic backend"):
+        load_backend("nope")
+
+
+def test_module_to_decimal_handles_non_ints():
+    assert arithmetic.to_decimal(8.0) == "8.0"
+    assert arithmetic.to_decimal(True) == "True"
+    assert arithmetic.to_decimal(10**30) == str(10**30)
@@ -0,0 +1,41 @@
+import pytest
+from benchmarks.harness import percentile, summarize, compare, run_load
+
+
+def test_percentile_nearest_rank():
+    values = [i / 100 for i in range(1, 101)]
+    assert percentile(values, 50) == 0.5
+    assert percentile(values, 95) == 0.95
+    assert percentile(values, 99) == 0.99
+    assert percentile([], 50) == 0.0
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile(list(range(1, 46)), 50) == 23
+    assert percentile([1, 2, 3], 100) == 3
+
+
+def test_summarize():
+    stats = summarize([0.1, 0.2, 0.3, 0.4])
+    assert stats["count"] == 4
+    assert stats["max"] == 0.4
+    assert stats["ops_per_sec"] == pytest.approx(4)
+
+
+def test_compare_flags_regressions():
+    baseline = {"a": {"p50": 1.0}, "b": {"p50": 1.0}, "gone": {"p50": 1.0}}
+    current = {"a": {"p50": 1.1}, "b": {"p50": 1.5}, "new": {"p50": 1.0}}
+    rows = {row[0]: row for row in compare(baseline, current, threshold=1.2)}
+    assert set(rows) == {"a", "b"}
+    assert not rows["a"][4]
+    assert rows["b"][4]
+
+
+@pytest.mark.asyncio
+async def test_run_load_counts_requests_and_errors():
+    async def call(i):
+        if i % 10 == 0:
+            raise RuntimeError("boom")
+
+    stats = await run_load(call, concurrency=4, total_requests=50)
+    assert stats["count"] == 45
+    assert stats["errors"] == 5
+    assert stats["concurrency"] == 4
@@ -4,6 +4,7 @@ from fastapi_cache.backends.inmemory import InMemoryBackend
 from fastapi_cache.decorator import cache
 import services.services as services
 from unittest.mock import AsyncMock
+from prometheus_client import REGISTRY
 
 
 @pytest.fixture(autouse=True)
@@ -87,3 +88,26 @@ async def test_calculate_factorial_caching(monkeypatch):
     result3 = await services.calculate_factorial(4)
     assert result3 == 24
     assert spy.await_count == 2
+
+
+def _cache_count(operation, outcome):
+    value = REGISTRY.get_sample_value(
+        "mathapp_cache_requests_total",
+        {"operation": operation, "outcome": outcome},
+    )
+    return value or 0
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_and_miss_counters():
+    hits = _cache_count("factorial", "hit")
+    misses = _cache_count("factorial", "miss")
+
+    # Argument unique to this test so the first call is a miss
+    assert await services.calculate_factorial(17) == 355687428096000
+    assert _cache_count("factorial", "miss") == misses + 1
+    assert _cache_count("factorial", "hit") == hits
+
+    assert await services.calculate_factorial(17) == 355687428096000
+    assert _cache_count("factorial", "miss") == misses + 1
+    assert _cache_count("factorial", "hit") == hits + 1
@@ -0,0 +1,70 @@
+import math
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from db.database import Base, check_schema
+from db.migrations import migrate_math_requests
+from models.models import MathRequest, MathResult, User
+from services.services import result_key, decode_result
+
+OLD_MATH_REQUESTS = (
+    "CREATE TABLE math_requests (id INTEGER PRIMARY KEY, operation VARCHAR, "
+    "param1 FLOAT, param2 FLOAT, result VARCHAR, timestamp DATETIME, "
+    "username VARCHAR)"
+)
+
+
+def test_check_schema_accepts_current_schema():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    check_schema(engine)
+
+
+def test_check_schema_rejects_old_math_requests_table():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text(OLD_MATH_REQUESTS))
+    Base.metadata.create_all(bind=engine)
+    with pytest.raises(RuntimeError, match="result_key.*db.migrations"):
+        check_schema(engine)
+
+
+def test_migrate_math_requests(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    factorial = str(math.factorial(200))
+    with engine.begin() as conn:
+        conn.execute(text(OLD_MATH_REQUESTS))
+        conn.execute(
+            text("CREATE INDEX ix_math_requests_operation ON math_requests (operation)")
+        )
+        conn.execute(
+            text(
+                "INSERT INTO math_requests VALUES "
+                "(1, 'factorial', 200.0, NULL, :f, '2025-01-01 00:00:00', 'alice'), "
+                "(2, 'factorial', 200.0, NULL, :f, '2025-01-02 00:00:00', 'bob'), "
+                "(3, 'pow', 2.0, 3.0, '8.0', '2025-01-03 00:00:00', 'alice')"
+            ),
+            {"f": factorial},
+        )
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add(User(username="admin", hashed_password="x", role="admin"))
+        db.commit()
+
+    assert migrate_math_requests(engine) == 3
+    check_schema(engine)
+    # Running it again is a no-op
+    assert migrate_math_requests(engine) == 0
+
+    with Session(engine) as db:
+        requests = db.query(MathRequest).order_by(MathRequest.id).all()
+        assert [r.id for r in requests] == [1, 2, 3]
+        assert [r.username for r in requests] == ["alice", "bob", "alice"]
+        # Keys match the ones persist_request computes for new requests
+        assert requests[0].result_key == result_key("factorial", 200, None)
+        assert requests[2].result_key == result_key("pow", 2.0, 3.0)
+        assert requests[0].param1 == "200"
+        assert decode_result(requests[0].result.value) == factorial
+        assert decode_result(requests[2].result.value) == "8.0"
+        assert db.query(MathResult).count() == 2
+        assert db.query(User).count() == 1
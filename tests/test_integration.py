@@ -1,10 +1,11 @@
 import os
+import math
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from db.database import Base, get_db
-from models.models import User, MathRequest
+from models.models import User, MathRequest, MathResult
 from controllers.controllers import get_password_hash
 from app import app
 
@@ -158,3 +159,152 @@ def test_admin_metrics_access(client):
     assert resp.status_code == 200
     assert resp.headers["content-type"].startswith("text/plain")
     assert b"# HELP" in resp.content  # Prometheus metrics
+
+
+def test_admin_profile(client):
+    client.post("/register", json={"username": "ivan", "password": "ivanpass"})
+    login_with_cookies(client, "ivan", "ivanpass")
+
+    resp = client.get("/admin/profile", params={"seconds": 0.1})
+    assert resp.status_code == 403
+
+    login_with_cookies(client, "superadmin", "adminpass")
+    resp = client.get("/admin/profile", params={"seconds": 0.2, "interval": 0.01})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert int(resp.headers["x-profile-samples"]) > 0
+    # Collapsed-stack format: "frame;frame;... count"
+    stack, count = resp.text.splitlines()[0].rsplit(" ", 1)
+    assert ":" in stack and int(count) > 0
+
+
+def test_admin_metrics_include_hot_path_stages(client):
+    client.post("/register", json={"username": "heidi", "password": "heidipass"})
+    login_with_cookies(client, "heidi", "heidipass")
+    client.post("/fibonacci", json={"n": 321})
+
+    login_with_cookies(client, "superadmin", "adminpass")
+    resp = client.get("/admin/metrics")
+    assert resp.status_code == 200
+    body = resp.text
+    for stage in (
+        "compute",
+        "cache_lookup",
+        "jwt_decode",
+        "audit_insert",
+        "log_handler",
+    ):
+        assert f'stage="{stage}"' in body
+    assert 'n_bucket="<1000",operation="fibonacci"' in body
+    assert "mathapp_cache_requests_total" in body
+    assert "mathapp_persistence_pending" in body
+    assert "mathapp_persistence_lag_seconds" in body
+
+
+def test_math_get_endpoints_are_cacheable(client):
+    client.post("/register", json={"username": "erin", "password": "erinpass"})
+    login_with_cookies(client, "erin", "erinpass")
+
+    resp = client.get("/fibonacci", params={"n": 7})
+    assert resp.status_code == 200
+    assert resp.json()["result"] == 13
+    assert "max-age" in resp.headers["cache-control"]
+    assert "private" in resp.headers["cache-control"]
+    etag = resp.headers["etag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    # POST and GET produce the same representation
+    resp = client.post("/fibonacci", json={"n": 7})
+    assert resp.headers["etag"] == etag
+
+    # Revalidation with a matching ETag returns 304 without a body
+    resp = client.get("/fibonacci", params={"n": 7}, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+    # If-None-Match is ignored for POST, which always returns the result
+    resp = client.post("/fibonacci", json={"n": 7}, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["result"] == 13
+
+    resp = client.get("/pow", params={"base": 2, "exponent": 10})
+    assert resp.status_code == 200
+    assert resp.json()["result"] == 1024
+
+    resp = client.get("/factorial", params={"n": -1})
+    assert resp.status_code == 422
+
+
+def test_large_results_are_compressed(client):
+    client.post("/register", json={"username": "frank", "password": "frankpass"})
+    login_with_cookies(client, "frank", "frankpass")
+
+    resp = client.get(
+        "/factorial", params={"n": 1000}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["etag"].startswith('W/"')
+    assert resp.headers["etag"].endswith('-gzip"')
+    assert "Accept-Encoding" in resp.headers["vary"]
+    # Big integers are still encoded as JSON numbers
+    assert resp.json()["result"] == math.factorial(1000)
+
+    # The encoded ETag revalidates against the same result
+    etag = resp.headers["etag"]
+    resp = client.get("/factorial", params={"n": 1000}, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag
+    assert "Accept-Encoding" in resp.headers["vary"]
+    assert "x-etag-per-encoding" not in resp.headers
+
+    # Small payloads are sent uncompressed
+    resp = client.get(
+        "/factorial", params={"n": 5}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert "content-encoding" not in resp.headers
+
+
+def test_static_files_revalidate_when_compressed(client):
+    resp = client.get("/view/frontend.html", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "x-etag-per-encoding" not in resp.headers
+    etag = resp.headers["etag"]
+
+    resp = client.get(
+        "/view/frontend.html",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert resp.status_code == 304
+
+
+def test_results_are_stored_once(client):
+    client.post("/register", json={"username": "grace", "password": "gracepass"})
+    login_with_cookies(client, "grace", "gracepass")
+
+    for _ in range(3):
+        resp = client.post("/factorial", json={"n": 200})
+        assert resp.status_code == 200
+
+    db = TestingSessionLocal()
+    requests = (
+        db.query(MathRequest)
+        .filter(MathRequest.username == "grace", MathRequest.operation == "factorial")
+        .all()
+    )
+    assert len(requests) == 3
+    assert len({r.result_key for r in requests}) == 1
+    assert requests[0].param1 == "200"
+    assert (
+        db.query(MathResult).filter(MathResult.key == requests[0].result_key).count()
+        == 1
+    )
+    db.close()
+
+    # Admin view still exposes the decoded result
+    login_with_cookies(client, "superadmin", "adminpass")
+    resp = client.get("/admin/requests")
+    entry = next(r for r in resp.json() if r["username"] == "grace")
+    assert entry["result"] == str(math.factorial(200))
@@ -0,0 +1,43 @@
+import asyncio
+import time
+import pytest
+from utils.profiler import Profiler, StackSampler
+
+
+def test_stack_sampler_collects_collapsed_stacks():
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    time.sleep(0.05)
+    sampler.stop()
+    assert not sampler.running
+    assert sampler.samples > 0
+    # The sampled main thread is sleeping inside this test
+    assert "test_stack_sampler_collects_collapsed_stacks" in sampler.collapsed()
+
+
+@pytest.mark.asyncio
+async def test_profile_stops_after_requests():
+    profiler = Profiler()
+
+    async def finish_requests():
+        await asyncio.sleep(0.05)
+        profiler.request_finished()
+        profiler.request_finished()
+
+    start = time.perf_counter()
+    task = asyncio.create_task(finish_requests())
+    sampler = await profiler.profile(seconds=10, requests=2, interval=0.001)
+    await task
+    assert time.perf_counter() - start < 5
+    assert sampler.samples > 0
+    assert profiler.sampler is None
+
+
+@pytest.mark.asyncio
+async def test_profile_rejects_concurrent_runs():
+    profiler = Profiler()
+    task = asyncio.create_task(profiler.profile(seconds=0.1))
+    await asyncio.sleep(0)
+    with pytest.raises(RuntimeError):
+        await profiler.profile(seconds=0.1)
+    await task
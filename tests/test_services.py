@@ -1,5 +1,6 @@
 import pytest
 from services.services import calculate_pow, calculate_fibonacci, calculate_factorial
+from services.services import result_key, encode_result, decode_result
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.inmemory import InMemoryBackend
 
@@ -40,3 +41,16 @@ async def test_calculate_fibonacci_negative():
 async def test_calculate_factorial_negative():
     with pytest.raises(ValueError, match="n must be >= 0"):
         await calculate_factorial(-5)
+
+
+def test_result_encoding_roundtrip():
+    value = 2**10000
+    encoded = encode_result(value)
+    assert len(encoded) < len(str(value))
+    assert decode_result(encoded) == str(value)
+
+
+def test_result_key_is_stable():
+    assert result_key("factorial", 5, None) == result_key("factorial", 5, None)
+    assert result_key("factorial", 5, None) != result_key("fibonacci", 5, None)
+    assert result_key("pow", 2.0, 3.0) != result_key("pow", 3.0, 2.0)
@@ -0,0 +1,70 @@
+import os
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder, IdentityResponder
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1024))
+COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", 6))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", 5))
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app, minimum_size: int, quality: int = BROTLI_QUALITY):
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        data = self.compressor.process(body)
+        if more_body:
+            return data + self.compressor.flush()
+        return data + self.compressor.finish()
+
+
+# Set by responses whose ETag should be tagged per encoding; removed before sending.
+# Other responses (e.g. StaticFiles) validate If-None-Match against their own
+# untagged ETag, so rewriting theirs would stop them ever returning 304.
+ETAG_PER_ENCODING_HEADER = "x-etag-per-encoding"
+
+
+def _tag_encoded_etag(send):
+    # The encoded body is not byte-stable (gzip embeds a timestamp), so its tag is
+    # weak, and it differs from the identity representation's strong tag
+    async def wrapped(message):
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            if ETAG_PER_ENCODING_HEADER in headers:
+                del headers[ETAG_PER_ENCODING_HEADER]
+                encoding = headers.get("content-encoding")
+                etag = headers.get("etag")
+                if encoding and etag and not etag.startswith("W/"):
+                    headers["ETag"] = f'W/{etag[:-1]}-{encoding}"'
+        await send(message)
+
+    return wrapped
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """GZip middleware that prefers brotli when it is installed and accepted."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("Accept-Encoding", "")
+        if brotli is not None and "br" in accept_encoding:
+            responder = BrotliResponder(self.app, self.minimum_size)
+        elif "gzip" in accept_encoding:
+            responder = GZipResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+
+        await responder(scope, receive, _tag_encoded_etag(send))
@@ -0,0 +1,79 @@
+import hashlib
+import os
+import re
+import orjson
+from fastapi import Request
+from fastapi.responses import ORJSONResponse, Response
+from services.arithmetic import to_decimal
+from utils.compression import ETAG_PER_ENCODING_HEADER
+
+# Math results are pure functions of their inputs, so they can be cached "forever".
+# The endpoints require the auth cookie, so only private (browser) caches may
+# store them: a shared cache would skip the JWT check and the audit log.
+CACHE_MAX_AGE = int(os.getenv("MATH_CACHE_MAX_AGE", 60 * 60 * 24 * 365))
+
+# orjson only serializes integers that fit in 64 bits
+_INT_MIN, _INT_MAX = -(2**63), 2**64 - 1
+
+# Suffixes added to the (weak) ETag by CompressionMiddleware for encoded representations
+_ENCODING_SUFFIX = re.compile(r"-(gzip|br)\"$")
+
+
+def _fragment_big_ints(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and not _INT_MIN <= value <= _INT_MAX:
+        # Emit the digits verbatim so big results stay JSON numbers
+        return orjson.Fragment(to_decimal(value).encode())
+    if isinstance(value, dict):
+        return {key: _fragment_big_ints(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_fragment_big_ints(item) for item in value]
+    return value
+
+
+class MathJSONResponse(ORJSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(_fragment_big_ints(content), option=orjson.OPT_NON_STR_KEYS)
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def matching_etag(if_none_match: str, etag: str):
+    """Return the tag from If-None-Match that matches `etag`, if any.
+
+    Tags of encoded representations (`W/"X-gzip"`) match their identity tag `"X"`,
+    and are returned unchanged so a 304 repeats the tag the client sent.
+    """
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == "*":
+        return etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if _ENCODING_SUFFIX.sub('"', candidate.removeprefix("W/")) == etag:
+            return candidate
+    return None
+
+
+def cacheable_response(request: Request, content: dict) -> Response:
+    response = MathJSONResponse(content)
+    etag = make_etag(response.body)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={CACHE_MAX_AGE}, immutable",
+        ETAG_PER_ENCODING_HEADER: "1",
+    }
+    # 304 is only defined for GET and HEAD; POST always runs and returns the body
+    matched = None
+    if request.method in ("GET", "HEAD"):
+        matched = matching_etag(request.headers.get("if-none-match"), etag)
+    if matched is not None:
+        headers["ETag"] = matched
+        # The 304 stands in for a response that may have been compressed
+        headers["Vary"] = "Accept-Encoding"
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
@@ -1,15 +1,19 @@
 import logging
 from db.database import SessionLocal
 from models.models import LogEntry
+from utils.metrics import observe_stage
 
 
 class DBLogHandler(logging.Handler):
     def emit(self, record):
         session = SessionLocal()
         try:
-            log_entry = LogEntry(level=record.levelname, message=self.format(record))
-            session.add(log_entry)
-            session.commit()
+            with observe_stage("log_handler"):
+                log_entry = LogEntry(
+                    level=record.levelname, message=self.format(record)
+                )
+                session.add(log_entry)
+                session.commit()
         except Exception:
             session.rollback()
         finally:
@@ -0,0 +1,118 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from fastapi_cache.decorator import cache
+from prometheus_client import Counter, Gauge, Histogram
+
+STAGE_BUCKETS = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+N_BUCKET_BOUNDS = (10, 100, 1000, 10000)
+
+STAGE_DURATION = Histogram(
+    "mathapp_stage_duration_seconds",
+    "Time spent in each stage of the request hot path",
+    ["stage", "operation", "n_bucket"],
+    buckets=STAGE_BUCKETS,
+)
+STAGE_ERRORS = Counter(
+    "mathapp_stage_errors_total",
+    "Failures in each stage of the request hot path",
+    ["stage", "operation"],
+)
+CACHE_REQUESTS = Counter(
+    "mathapp_cache_requests_total",
+    "Result cache lookups by outcome",
+    ["operation", "outcome"],
+)
+PERSIST_PENDING = Gauge(
+    "mathapp_persistence_pending",
+    "Persistence tasks queued but not yet finished",
+)
+PERSIST_LAG = Gauge(
+    "mathapp_persistence_lag_seconds",
+    "Delay between queueing a persistence task and it starting",
+)
+
+# Set by the undecorated function so the cache wrapper can tell a hit from a miss
+_compute_seconds: ContextVar = ContextVar("compute_seconds", default=None)
+
+
+def n_bucket(n) -> str:
+    if n is None:
+        return "none"
+    n = abs(n)
+    for bound in N_BUCKET_BOUNDS:
+        if n < bound:
+            return f"<{bound}"
+    return f">={N_BUCKET_BOUNDS[-1]}"
+
+
+@contextmanager
+def observe_stage(stage: str, operation: str = "none", n=None):
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.labels(stage, operation).inc()
+        raise
+    finally:
+        STAGE_DURATION.labels(stage, operation, n_bucket(n)).observe(
+            time.perf_counter() - start
+        )
+
+
+def instrumented_cache(operation: str, expire: int, size=lambda n: n):
+    """`@cache` that also records compute time, cache lookup time and hits/misses.
+
+    `size` maps the call arguments to the number used for the n-bucket label.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def compute(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                with observe_stage("compute", operation, size(*args, **kwargs)):
+                    return await func(*args, **kwargs)
+            finally:
+                _compute_seconds.set(time.perf_counter() - start)
+
+        cached = cache(expire=expire)(compute)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            reset = _compute_seconds.set(None)
+            start = time.perf_counter()
+            try:
+                return await cached(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                compute_seconds = _compute_seconds.get()
+                _compute_seconds.reset(reset)
+                outcome = "hit" if compute_seconds is None else "miss"
+                CACHE_REQUESTS.labels(operation, outcome).inc()
+                STAGE_DURATION.labels(
+                    "cache_lookup", operation, n_bucket(size(*args, **kwargs))
+                ).observe(elapsed - (compute_seconds or 0))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,110 @@
+import asyncio
+import sys
+import threading
+from collections import Counter
+
+
+class StackSampler:
+    """Samples the stacks of all threads and aggregates them as collapsed stacks.
+
+    Nothing runs while the sampler is stopped, so it costs nothing when off.
+    The output is the `frame;frame;frame count` format read by flamegraph.pl
+    and speedscope.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self.stacks[_collapse(frame)] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+
+def _collapse(frame) -> str:
+    names = []
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "?")
+        names.append(f"{module}:{frame.f_code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class Profiler:
+    """Runs one StackSampler at a time for a number of seconds or requests."""
+
+    def __init__(self):
+        self.sampler = None
+        self._remaining_requests = None
+        self._done = None
+
+    async def profile(self, seconds: float, requests: int = None, interval=0.005):
+        if self.sampler is not None:
+            raise RuntimeError("A profile is already running")
+        self.sampler = StackSampler(interval)
+        self._remaining_requests = requests
+        self._done = asyncio.Event()
+        self.sampler.start()
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            sampler, self.sampler = self.sampler, None
+            sampler.stop()
+        return sampler
+
+    def request_finished(self):
+        if self._remaining_requests is None:
+            return
+        self._remaining_requests -= 1
+        if self._remaining_requests <= 0:
+            self._done.set()
+
+
+profiler = Profiler()
+
+
+class ProfilerMiddleware:
+    """Counts finished requests so a profile can stop after N requests."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or profiler.sampler is None:
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if profiler.sampler is not None:
+                profiler.request_finished()